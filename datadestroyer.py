@@ -5,37 +5,255 @@ import threading
 import sys
 import datetime
 import hashlib
+import heapq
+import itertools
+import json
+import queue
+import socket
+import socketserver
+import signal
+import argparse
 import subprocess
 import pwd
 import grp
+import stat
+import time
+import functools
+import tempfile
+import bisect
+import fnmatch
+import re
+import cProfile
+import pstats
+import tracemalloc
+from contextlib import contextmanager
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QLabel, QLineEdit, QPushButton, 
                              QRadioButton, QButtonGroup, QSpinBox, QTextEdit, 
                              QProgressBar, QFileDialog, QMessageBox, QCheckBox,
-                             QTreeWidget, QTreeWidgetItem, QTabWidget)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSize, QTimer
+                             QTreeWidget, QTreeWidgetItem, QTabWidget, QTableView,
+                             QAbstractItemView, QHeaderView)
+from PyQt5.QtCore import (Qt, QThread, pyqtSignal, QSize, QTimer,
+                          QAbstractTableModel, QModelIndex)
 from PyQt5.QtGui import QIcon, QFont, QColor, QPalette
 
+# Performance instrumentation
+# Optional node-exporter textfile collector target, e.g.
+# /var/lib/node_exporter/textfile_collector/datadestroyer.prom
+METRICS_TEXTFILE = os.environ.get("DATADESTROYER_METRICS_TEXTFILE")
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0)
+BYTES_BUCKETS = (4096, 65536, 1048576, 16777216, 268435456, 1073741824, 17179869184)
+
+class Histogram:
+    """Fixed-bucket histogram with Prometheus semantics (le is inclusive)"""
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """Yield (le, cumulative count) pairs, ending with +Inf"""
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            yield repr(float(bound)), total
+        yield "+Inf", self.count
+
+class PhaseMetrics:
+    """Thread-safe per-phase latency, byte and operation counters"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.latency = {}
+            self.bytes = {}
+            self.operations = {}
+            self.errors = {}
+
+    def record(self, name, seconds, nbytes=None, failed=False):
+        with self.lock:
+            if name not in self.latency:
+                self.latency[name] = Histogram(LATENCY_BUCKETS)
+                self.operations[name] = 0
+                self.errors[name] = 0
+            self.latency[name].observe(seconds)
+            self.operations[name] += 1
+            if failed:
+                self.errors[name] += 1
+            if nbytes is not None:
+                if name not in self.bytes:
+                    self.bytes[name] = Histogram(BYTES_BUCKETS)
+                self.bytes[name].observe(nbytes)
+
+    @contextmanager
+    def phase(self, name, nbytes=None):
+        """Time the enclosed block and account it to the given phase"""
+        failed = False
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start, nbytes, failed)
+
+    def summary(self):
+        """Return human-readable per-phase totals, slowest phase first"""
+        with self.lock:
+            phases = sorted(self.latency.items(), key=lambda item: item[1].sum, reverse=True)
+            lines = []
+            for name, hist in phases:
+                line = f"{name}: {hist.count} ops, {hist.sum:.3f}s total, {hist.sum / hist.count * 1000:.2f}ms avg"
+                if name in self.bytes:
+                    line += f", {format_size(self.bytes[name].sum)}"
+                if self.errors[name]:
+                    line += f", {self.errors[name]} errors"
+                lines.append(line)
+            return lines
+
+    def to_prometheus(self):
+        """Render all counters in the Prometheus text exposition format"""
+        out = []
+        with self.lock:
+            out.append("# HELP datadestroyer_phase_duration_seconds Time spent per destruction phase.")
+            out.append("# TYPE datadestroyer_phase_duration_seconds histogram")
+            for name, hist in sorted(self.latency.items()):
+                for le, count in hist.cumulative():
+                    out.append(f'datadestroyer_phase_duration_seconds_bucket{{phase="{name}",le="{le}"}} {count}')
+                out.append(f'datadestroyer_phase_duration_seconds_sum{{phase="{name}"}} {hist.sum:.9f}')
+                out.append(f'datadestroyer_phase_duration_seconds_count{{phase="{name}"}} {hist.count}')
+
+            out.append("# HELP datadestroyer_phase_bytes Bytes handled per destruction phase operation.")
+            out.append("# TYPE datadestroyer_phase_bytes histogram")
+            for name, hist in sorted(self.bytes.items()):
+                for le, count in hist.cumulative():
+                    out.append(f'datadestroyer_phase_bytes_bucket{{phase="{name}",le="{le}"}} {count}')
+                out.append(f'datadestroyer_phase_bytes_sum{{phase="{name}"}} {hist.sum}')
+                out.append(f'datadestroyer_phase_bytes_count{{phase="{name}"}} {hist.count}')
+
+            out.append("# HELP datadestroyer_phase_operations_total Operations executed per destruction phase.")
+            out.append("# TYPE datadestroyer_phase_operations_total counter")
+            for name, count in sorted(self.operations.items()):
+                out.append(f'datadestroyer_phase_operations_total{{phase="{name}"}} {count}')
+
+            out.append("# HELP datadestroyer_phase_errors_total Failed operations per destruction phase.")
+            out.append("# TYPE datadestroyer_phase_errors_total counter")
+            for name, count in sorted(self.errors.items()):
+                out.append(f'datadestroyer_phase_errors_total{{phase="{name}"}} {count}')
+
+        out.append("# HELP datadestroyer_last_export_timestamp_seconds Time of the last metrics export.")
+        out.append("# TYPE datadestroyer_last_export_timestamp_seconds gauge")
+        out.append(f"datadestroyer_last_export_timestamp_seconds {time.time():.3f}")
+        return "\n".join(out) + "\n"
+
+# Global metrics registry shared by all destruction jobs
+metrics = PhaseMetrics()
+
+def write_prometheus_textfile(path, phase_metrics=None):
+    """Atomically write metrics for the node-exporter textfile collector"""
+    phase_metrics = phase_metrics or metrics
+    # node-exporter only reads *.prom files, so the temporary file is never scraped half-written
+    # Per-thread name: daemon workers may export concurrently
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(phase_metrics.to_prometheus())
+    os.replace(tmp_path, path)
+
+def profile_job(func, *args, profile_path=None, update_callback=None, **kwargs):
+    """Run func under cProfile and tracemalloc and report the results"""
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        current, peak = tracemalloc.get_traced_memory()
+        top_allocations = tracemalloc.take_snapshot().statistics("lineno")[:5]
+        if started_tracing:
+            tracemalloc.stop()
+
+        if profile_path:
+            profiler.dump_stats(profile_path)
+        if update_callback:
+            update_callback(f"Memory: {format_size(current)} current, {format_size(peak)} peak")
+            for stat in top_allocations:
+                update_callback(f"  {stat}")
+            stats = pstats.Stats(profiler)
+            for (filename, line, name), (_, ncalls, _, cumtime, _) in sorted(
+                    stats.stats.items(), key=lambda item: item[1][3], reverse=True)[:10]:
+                update_callback(f"  {cumtime:.3f}s {ncalls} calls {name} ({os.path.basename(filename)}:{line})")
+            if profile_path:
+                update_callback(f"Profile saved to: {profile_path}")
+
 # Core functionality
+def nofollow_opener(path, flags):
+    """Open a file without following a symlink swapped in after the checks"""
+    return os.open(path, flags | getattr(os, "O_NOFOLLOW", 0))
+
+def write_pass(d, file_size, pattern):
+    """Write a single overwrite pass over the whole file and sync it to disk"""
+    with metrics.phase("pattern", file_size):
+        if pattern == "random":
+            data = os.urandom(file_size)
+        else:
+            data = pattern * file_size
+    
+    # d is unbuffered, so each write() is one write(2) that may be short
+    # (Linux caps it at about 2 GiB); loop and record the bytes really written
+    written = 0
+    failed = True
+    start = time.perf_counter()
+    try:
+        d.seek(0)
+        view = memoryview(data)
+        while written < file_size:
+            count = d.write(view[written:])
+            if not count:
+                raise OSError(f"Short write at offset {written} of {file_size}")
+            written += count
+        d.flush()
+        failed = False
+    finally:
+        metrics.record("write", time.perf_counter() - start, written, failed)
+    with metrics.phase("fsync"):
+        os.fsync(d.fileno())
+
 def overwrite_file(file_path, passes=3, mode="standard", update_callback=None):
     try:
         # Check if file exists and is accessible
-        if not os.path.exists(file_path):
+        with metrics.phase("access_check"):
+            exists = os.path.exists(file_path)
+            # Check file permissions (important for Linux)
+            writable = exists and os.access(file_path, os.W_OK)
+            file_size = os.path.getsize(file_path) if writable else 0
+
+        if not exists:
             if update_callback:
                 update_callback(0, passes, "Error: File does not exist.")
             return False
             
-        # Check file permissions (important for Linux)
-        if not os.access(file_path, os.W_OK):
+        if not writable:
             if update_callback:
                 update_callback(0, passes, "Error: No write permission for this file.")
             return False
-            
-        file_size = os.path.getsize(file_path)
         
         # Ensure we have enough disk space for overwriting
         try:
-            fs_stats = os.statvfs(os.path.dirname(file_path))
+            with metrics.phase("statvfs"):
+                fs_stats = os.statvfs(os.path.dirname(file_path))
             free_space = fs_stats.f_frsize * fs_stats.f_bavail
             if mode == "nsa" and free_space < file_size * 4:
                 if update_callback:
@@ -52,53 +270,39 @@ def overwrite_file(file_path, passes=3, mode="standard", update_callback=None):
 
         # Flush filesystem buffers to ensure all previous changes are written
         try:
-            os.fsync(os.open(os.path.dirname(file_path), os.O_RDONLY))
+            with metrics.phase("fsync"):
+                os.fsync(os.open(os.path.dirname(file_path), os.O_RDONLY))
         except (AttributeError, OSError):
             # Not all platforms support this
             pass
 
-        with open(file_path, "ba+", buffering=0) as d:
+        with open(file_path, "rb+", buffering=0, opener=nofollow_opener) as d:
             if mode == "nsa":
                 # NSA recommended pattern (4 passes with specific patterns)
                 # Pass 1: Random data
                 if update_callback:
                     update_callback(1, 4, "Overwriting pass 1/4: Random data...")
-                d.seek(0)
-                d.write(os.urandom(file_size))
-                d.flush()
-                os.fsync(d.fileno())
+                write_pass(d, file_size, "random")
                 
                 # Pass 2: All zeros (0x00)
                 if update_callback:
                     update_callback(2, 4, "Overwriting pass 2/4: All zeros...")
-                d.seek(0)
-                d.write(b'\x00' * file_size)
-                d.flush()
-                os.fsync(d.fileno())
+                write_pass(d, file_size, b'\x00')
                 
                 # Pass 3: All ones (0xFF)
                 if update_callback:
                     update_callback(3, 4, "Overwriting pass 3/4: All ones...")
-                d.seek(0)
-                d.write(b'\xFF' * file_size)
-                d.flush()
-                os.fsync(d.fileno())
+                write_pass(d, file_size, b'\xFF')
                 
                 # Pass 4: Random data again
                 if update_callback:
                     update_callback(4, 4, "Overwriting pass 4/4: Random data...")
-                d.seek(0)
-                d.write(os.urandom(file_size))
-                d.flush()
-                os.fsync(d.fileno())
+                write_pass(d, file_size, "random")
             else:  # Standard mode: multiple random passes
                 for i in range(passes):
                     if update_callback:
                         update_callback(i+1, passes, f"Overwriting pass {i+1}/{passes}...")
-                    d.seek(0)
-                    d.write(os.urandom(file_size))
-                    d.flush()
-                    os.fsync(d.fileno())
+                    write_pass(d, file_size, "random")
                     
         return True
     except PermissionError as e:
@@ -118,12 +322,15 @@ def overwrite_file(file_path, passes=3, mode="standard", update_callback=None):
             update_callback(0, passes, f"Error overwriting file: {e}")
         return False
 
+def random_name(length=12):
+    return ''.join(random.choices(string.ascii_letters + string.digits, k=length))
+
 def rename_file(file_path, update_callback=None):
     dir_name = os.path.dirname(file_path)
-    random_name = ''.join(random.choices(string.ascii_letters + string.digits, k=12))
-    new_path = os.path.join(dir_name, random_name)
+    new_path = os.path.join(dir_name, random_name())
     try:
-        os.rename(file_path, new_path)
+        with metrics.phase("rename"):
+            os.rename(file_path, new_path)
         if update_callback:
             update_callback(f"File renamed to: {new_path}")
         return new_path
@@ -134,7 +341,8 @@ def rename_file(file_path, update_callback=None):
 
 def delete_file(file_path, update_callback=None):
     try:
-        os.remove(file_path)
+        with metrics.phase("delete"):
+            os.remove(file_path)
         if update_callback:
             update_callback("File deleted successfully.")
         
@@ -169,20 +377,12 @@ def get_file_info(file_path):
         file_hash = "Not calculated (file too large)"
         if file_size < 10 * 1024 * 1024:  # Only for files < 10MB
             try:
-                with open(file_path, 'rb') as f:
-                    file_hash = hashlib.md5(f.read()).hexdigest()
+                file_hash = calculate_file_hash(file_path)
             except Exception:
                 file_hash = "Error calculating hash"
         
         permissions = oct(stat_info.st_mode)[-3:]
-        permissions_text = ""
-        try:
-            import pwd, grp
-            user = pwd.getpwuid(stat_info.st_uid).pw_name
-            group = grp.getgrgid(stat_info.st_gid).gr_name
-            permissions_text = f"{user}:{group}"
-        except (ImportError, KeyError):
-            permissions_text = f"UID:{stat_info.st_uid} GID:{stat_info.st_gid}"
+        permissions_text = get_owner(stat_info.st_uid, stat_info.st_gid)
         
         # Sembolik bağlantı kontrolü
         link_target = ""
@@ -222,6 +422,50 @@ def get_filesystem_type(path):
     except:
         return "Unknown"
 
+@functools.lru_cache(maxsize=1024)
+def get_owner(uid, gid):
+    """Resolve uid/gid to "user:group", cached since folders share few owners"""
+    try:
+        user = pwd.getpwuid(uid).pw_name
+        group = grp.getgrgid(gid).gr_name
+        return f"{user}:{group}"
+    except KeyError:
+        return f"UID:{uid} GID:{gid}"
+
+def calculate_file_hash(file_path, chunk_size=1024 * 1024):
+    """Calculate the MD5 hash of a regular file without loading it into memory"""
+    # Only regular files: symlinks may point out of the tree, FIFOs would block forever
+    if not stat.S_ISREG(os.lstat(file_path).st_mode):
+        raise ValueError("Not a regular file")
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_NOFOLLOW", 0) | getattr(os, "O_NONBLOCK", 0))
+    # Re-check on the open descriptor in case the entry was swapped after the lstat
+    if not stat.S_ISREG(os.fstat(fd).st_mode):
+        os.close(fd)
+        raise ValueError("Not a regular file")
+    file_hash = hashlib.md5()
+    with open(fd, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+def parse_size(text):
+    """Parse a size such as "512", "10K", "1.5M" or "2G" into bytes"""
+    original = text
+    text = text.strip().upper().rstrip("B")
+    units = {"K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+    multiplier = 1
+    if text and text[-1] in units:
+        multiplier = units[text[-1]]
+        text = text[:-1]
+    try:
+        value = float(text)
+        # NaN fails the comparison too; inf and 1e400 overflow in int()
+        if not value >= 0:
+            raise ValueError
+        return int(value * multiplier)
+    except (ValueError, OverflowError):
+        raise ValueError(f"Invalid size: {original}")
+
 def format_size(size_bytes):
     """Format file size to human-readable format"""
     if size_bytes < 1024:
@@ -233,17 +477,356 @@ def format_size(size_bytes):
     else:
         return f"{size_bytes / (1024 * 1024 * 1024):.2f} GB"
 
-def secure_delete(file_path, passes, mode="standard", update_callback=None):
-    if not os.path.isfile(file_path):
+def scrub_files(file_paths, update_callback=None):
+    """Truncate, rename and unlink wiped files, one directory batch at a time
+
+    Entries are addressed relative to an open directory descriptor, and
+    each directory is fsynced once per batch instead of once per file.
+    Returns the paths that could not be removed.
+    """
+    batches = {}
+    for file_path in file_paths:
+        batches.setdefault(os.path.dirname(file_path) or ".", []).append(os.path.basename(file_path))
+    
+    failed = []
+    for dir_path, names in batches.items():
+        try:
+            dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as e:
+            if update_callback:
+                update_callback(f"Error opening directory {dir_path}: {e}")
+            failed.extend(os.path.join(dir_path, name) for name in names)
+            continue
+        try:
+            for name in names:
+                try:
+                    # Drop the data extents before the name goes away
+                    with metrics.phase("truncate"):
+                        fd = os.open(name, os.O_WRONLY | getattr(os, "O_NOFOLLOW", 0), dir_fd=dir_fd)
+                        try:
+                            os.ftruncate(fd, 0)
+                        finally:
+                            os.close(fd)
+                    new_name = random_name()
+                    with metrics.phase("rename"):
+                        os.rename(name, new_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+                    with metrics.phase("delete"):
+                        os.unlink(new_name, dir_fd=dir_fd)
+                except OSError as e:
+                    failed.append(os.path.join(dir_path, name))
+                    if update_callback:
+                        update_callback(f"Error scrubbing {os.path.join(dir_path, name)}: {e}")
+            with metrics.phase("fsync"):
+                os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    return failed
+
+def remove_directories(directories, update_callback=None):
+    """Rename empty directories to random names and remove them, deepest first
+
+    Directories that still hold entries (filtered or skipped files) are
+    left in place. Each parent is fsynced once after its children are
+    removed. Returns the number of directories removed.
+    """
+    removed = 0
+    # Normalise first: a trailing slash or relative root would break depth and parent lookups
+    directories = {os.path.abspath(path) for path in directories}
+    # Deepest first, grouped by parent, so every child is gone before its parent's turn
+    ordered = sorted(directories, key=lambda path: (-path.count(os.sep), os.path.dirname(path)))
+    for parent, children in itertools.groupby(ordered, key=os.path.dirname):
+        try:
+            parent_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError as e:
+            if update_callback:
+                update_callback(f"Error opening directory {parent}: {e}")
+            continue
+        try:
+            for dir_path in children:
+                try:
+                    if os.listdir(dir_path):
+                        continue
+                    new_name = random_name()
+                    with metrics.phase("rename"):
+                        os.rename(os.path.basename(dir_path), new_name, src_dir_fd=parent_fd, dst_dir_fd=parent_fd)
+                    with metrics.phase("rmdir"):
+                        os.rmdir(new_name, dir_fd=parent_fd)
+                    removed += 1
+                except OSError as e:
+                    if update_callback:
+                        update_callback(f"Error removing directory {dir_path}: {e}")
+            with metrics.phase("fsync"):
+                os.fsync(parent_fd)
+        finally:
+            os.close(parent_fd)
+    return removed
+
+def secure_delete(file_path, passes, mode="standard", update_callback=None, remove=True):
+    try:
+        with metrics.phase("stat"):
+            st = os.lstat(file_path)
+    except OSError:
+        st = None
+    # Never overwrite through a symlink: the target may live outside the selection
+    if st is not None and stat.S_ISLNK(st.st_mode):
+        if update_callback:
+            update_callback(f"Skipping symbolic link: {file_path}")
+        return False
+    if st is None or not stat.S_ISREG(st.st_mode):
         if update_callback:
             update_callback("Not a valid file.")
         return False
 
     success = overwrite_file(file_path, passes, mode, update_callback)
-    if success:
+    # Without remove the caller scrubs the metadata later, in batches
+    if success and remove:
         renamed_path = rename_file(file_path, update_callback)
         return delete_file(renamed_path, update_callback)
-    return False
+    return success
+
+class InodeIndex:
+    """Group the files of a folder scan by inode so each is overwritten only once"""
+    def __init__(self):
+        # (st_dev, st_ino) -> hardlinked paths, in scan order
+        self.inodes = {}
+        # (st_dev, st_ino) -> st_nlink, to spot links that were not selected
+        self.link_counts = {}
+        self.symlinks = []
+        self.special_files = []
+        self.filtered_files = 0
+        self.pruned_dirs = 0
+        # Every directory that was descended into, including the root
+        self.directories = []
+    
+    def add(self, path, st):
+        if stat.S_ISLNK(st.st_mode):
+            self.symlinks.append(path)
+        elif stat.S_ISREG(st.st_mode):
+            self.inodes.setdefault((st.st_dev, st.st_ino), []).append(path)
+            self.link_counts[(st.st_dev, st.st_ino)] = st.st_nlink
+        else:
+            # FIFOs, sockets and device nodes have no data of their own to overwrite
+            self.special_files.append(path)
+    
+    def primary_paths(self):
+        """One path per inode; this is the one that gets overwritten"""
+        return [paths[0] for paths in self.inodes.values()]
+    
+    def extra_links(self):
+        """Map each primary path to its other hard links, which only need unlinking"""
+        return {paths[0]: paths[1:] for paths in self.inodes.values() if len(paths) > 1}
+    
+    def shared_inodes(self):
+        """Count inodes that also have hard links which are excluded or outside the folder"""
+        return sum(1 for key, paths in self.inodes.items() if self.link_counts[key] > len(paths))
+    
+    def __len__(self):
+        return len(self.inodes)
+
+def compile_globs(patterns):
+    """Compile glob patterns into (name regex, relative path regex)
+
+    Patterns containing a slash match the path relative to the scanned
+    folder, all others match the entry name, as in .gitignore files.
+    """
+    if isinstance(patterns, str):
+        raise ValueError("Glob patterns must be a list, not a single string")
+    name_patterns = []
+    path_patterns = []
+    for pattern in patterns:
+        if "/" in pattern:
+            path_patterns.append(fnmatch.translate(pattern.strip("/")))
+        else:
+            name_patterns.append(fnmatch.translate(pattern))
+    name_regex = re.compile("|".join(name_patterns)) if name_patterns else None
+    path_regex = re.compile("|".join(path_patterns)) if path_patterns else None
+    return name_regex, path_regex
+
+class ScanFilter:
+    """Include/exclude predicates for folder scans, compiled once per job"""
+    def __init__(self, root_path, include=(), exclude=(), min_size=None, max_size=None,
+                 older_than_days=None, newer_than_days=None, user=None, group=None,
+                 same_filesystem=False):
+        self.root_path = root_path
+        self.include = compile_globs(include) if include else None
+        self.exclude = compile_globs(exclude) if exclude else None
+        self.min_size = min_size
+        self.max_size = max_size
+        
+        now = time.time()
+        self.mtime_before = now - older_than_days * 86400 if older_than_days else None
+        self.mtime_after = now - newer_than_days * 86400 if newer_than_days else None
+        
+        self.uid = self.resolve_id(user, pwd.getpwnam, "pw_uid", "user")
+        self.gid = self.resolve_id(group, grp.getgrnam, "gr_gid", "group")
+        self.root_dev = os.lstat(root_path).st_dev if same_filesystem else None
+    
+    @staticmethod
+    def resolve_id(name, lookup, field, kind):
+        # Names are resolved once here instead of looking up every file's owner
+        if not name:
+            return None
+        try:
+            return getattr(lookup(name), field)
+        except KeyError:
+            if name.isdigit():
+                return int(name)
+            raise ValueError(f"Unknown {kind}: {name}")
+    
+    def matches(self, compiled, name, path):
+        name_regex, path_regex = compiled
+        if name_regex and name_regex.match(name):
+            return True
+        if path_regex and path_regex.match(os.path.relpath(path, self.root_path)):
+            return True
+        return False
+    
+    def descend(self, entry):
+        """Return False for directories that should be pruned from the scan"""
+        if self.exclude and self.matches(self.exclude, entry.name, entry.path):
+            return False
+        if self.root_dev is not None and entry.stat(follow_symlinks=False).st_dev != self.root_dev:
+            return False
+        return True
+    
+    def match_file(self, path, st):
+        """Return True if a regular file with the given lstat result is selected"""
+        # Cheap numeric checks first, glob matching last
+        if self.min_size is not None and st.st_size < self.min_size:
+            return False
+        if self.max_size is not None and st.st_size > self.max_size:
+            return False
+        if self.mtime_before is not None and st.st_mtime > self.mtime_before:
+            return False
+        if self.mtime_after is not None and st.st_mtime < self.mtime_after:
+            return False
+        if self.uid is not None and st.st_uid != self.uid:
+            return False
+        if self.gid is not None and st.st_gid != self.gid:
+            return False
+        if self.root_dev is not None and st.st_dev != self.root_dev:
+            return False
+        
+        name = os.path.basename(path)
+        if self.exclude and self.matches(self.exclude, name, path):
+            return False
+        if self.include and not self.matches(self.include, name, path):
+            return False
+        return True
+
+def scan_folder(folder_path, scan_filter=None):
+    """Walk a folder without following symlinks and build its inode index"""
+    index = InodeIndex()
+    pending_dirs = [folder_path]
+    while pending_dirs:
+        current_dir = pending_dirs.pop()
+        index.directories.append(current_dir)
+        try:
+            with metrics.phase("scan"):
+                entries = list(os.scandir(current_dir))
+        except OSError:
+            continue
+        # Keep a stable, readable order within each directory
+        entries.sort(key=lambda entry: entry.name)
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if scan_filter and not scan_filter.descend(entry):
+                        index.pruned_dirs += 1
+                    else:
+                        pending_dirs.append(entry.path)
+                    continue
+                st = entry.stat(follow_symlinks=False)
+                if scan_filter and stat.S_ISREG(st.st_mode) and not scan_filter.match_file(entry.path, st):
+                    index.filtered_files += 1
+                    continue
+                index.add(entry.path, st)
+            except OSError:
+                continue
+    return index
+
+def destroy_files(files_to_process, passes, mode="standard", extra_links=None, scan_filter=None,
+                  status_callback=None, progress_callback=None, should_stop=None,
+                  scrub_metadata=False, directories=()):
+    """Securely delete a list of files and return the paths that could not be destroyed
+
+    With scrub_metadata, files are only overwritten in the main loop;
+    truncation, renaming and unlinking happen afterwards in per-directory
+    batches, followed by removal of the now empty directories.
+    """
+    extra_links = extra_links or {}
+    status_callback = status_callback or (lambda message: None)
+    progress_callback = progress_callback or (lambda percent, file_num, message: None)
+    total_files = len(files_to_process)
+    failed = []
+    wiped = []
+    
+    for idx, file_path in enumerate(files_to_process):
+        if should_stop and should_stop():
+            status_callback(f"Stopped before file {idx+1} of {total_files}")
+            failed.extend(files_to_process[idx:])
+            break
+        status_callback(f"Processing file {idx+1} of {total_files}: {os.path.basename(file_path)}")
+        
+        # Define a callback for progress updates
+        def update_callback(current=0, total=0, message=""):
+            if isinstance(current, str):  # For string messages
+                status_callback(current)
+            else:  # For progress updates
+                progress_percent = int((idx * passes + current) / (total_files * passes) * 100)
+                progress_callback(progress_percent, idx+1, message)
+        
+        # Process the file
+        try:
+            st = os.lstat(file_path)
+            file_size = st.st_size
+        except OSError:
+            st = None
+            file_size = 0
+        if scan_filter and st is not None and stat.S_ISREG(st.st_mode) \
+                and not scan_filter.match_file(file_path, st):
+            status_callback(f"Skipping {file_path}: no longer matches the filters")
+            continue
+        
+        # Overwriting is per inode but selection is per path: if the data also has
+        # hard links that were excluded or lie outside the selection, keep the data
+        links = extra_links.get(file_path, [])
+        if st is not None and stat.S_ISREG(st.st_mode) and st.st_nlink > 1 + len(links):
+            outside = st.st_nlink - 1 - len(links)
+            status_callback(f"Not overwriting {file_path}: its data is shared with {outside} "
+                            f"unselected hard link{'s' if outside != 1 else ''}, unlinking selected names only")
+            for link_path in [file_path] + links:
+                renamed_path = rename_file(link_path, update_callback)
+                if not delete_file(renamed_path, update_callback):
+                    failed.append(link_path)
+            continue
+        with metrics.phase("file", file_size):
+            success = secure_delete(file_path, passes, mode, update_callback, remove=not scrub_metadata)
+        if not success:
+            status_callback(f"Failed to destroy: {file_path}")
+            failed.append(file_path)
+            continue
+        
+        if scrub_metadata:
+            wiped.append(file_path)
+            wiped.extend(links)
+            continue
+        
+        # The inode is already overwritten, so the remaining hard links only need unlinking
+        for link_path in links:
+            status_callback(f"Removing hard link: {link_path}")
+            delete_file(link_path, update_callback)
+    
+    if scrub_metadata:
+        progress_callback(100, total_files, "Scrubbing metadata...")
+        scrub_failed = scrub_files(wiped, status_callback)
+        failed.extend(scrub_failed)
+        removed = remove_directories(directories, status_callback)
+        status_callback(f"Metadata scrubbed: {len(wiped) - len(scrub_failed)} entries unlinked, "
+                        f"{removed} director{'ies' if removed != 1 else 'y'} removed")
+    
+    progress_callback(100, total_files, "All files processed")
+    return failed
 
 # Worker thread for file processing
 class DestructionWorker(QThread):
@@ -256,28 +839,702 @@ class DestructionWorker(QThread):
         self.files_to_process = files_to_process
         self.passes = passes
         self.deletion_mode = "standard"
+        # Primary path -> other hard links to the same inode, unlinked once it is wiped
+        self.extra_links = {}
+        # Re-checked before each wipe in case a file changed since the scan
+        self.scan_filter = None
+        self.scrub_metadata = False
+        self.directories = []
+        self.profiling = False
+        self.profile_path = None
+        self.metrics_textfile = METRICS_TEXTFILE
     
     def run(self):
-        total_files = len(self.files_to_process)
+        if self.profiling:
+            self.status_update.emit("Profiling enabled (cProfile + tracemalloc)")
+            profile_job(self.process_files, profile_path=self.profile_path,
+                        update_callback=self.status_update.emit)
+        else:
+            self.process_files()
+
+        self.status_update.emit("Phase timings (since startup):")
+        for line in metrics.summary():
+            self.status_update.emit(f"  {line}")
+
+        if self.metrics_textfile:
+            try:
+                write_prometheus_textfile(self.metrics_textfile)
+                self.status_update.emit(f"Metrics exported to: {self.metrics_textfile}")
+            except OSError as e:
+                self.status_update.emit(f"Error exporting metrics: {e}")
+
+        self.operation_complete.emit(True)
+
+    def process_files(self):
+        destroy_files(self.files_to_process, self.passes, self.deletion_mode, self.extra_links,
+                      self.scan_filter, self.status_update.emit, self.progress_update.emit,
+                      scrub_metadata=self.scrub_metadata, directories=self.directories)
+
+# Folder inventory
+class InventoryScanner(QThread):
+    """Walk a folder in the background and deliver stat metadata in batches"""
+    batch_ready = pyqtSignal(list)
+    scan_complete = pyqtSignal(int, int)
+    
+    def __init__(self, folder_path, batch_size=2000):
+        super().__init__()
+        self.folder_path = folder_path
+        self.batch_size = batch_size
+        self.cancelled = False
+    
+    def stop(self):
+        self.cancelled = True
+    
+    def run(self):
+        batch = []
+        scanned = 0
+        errors = 0
+        pending_dirs = [self.folder_path]
         
-        for idx, file_path in enumerate(self.files_to_process):
-            self.status_update.emit(f"Processing file {idx+1} of {total_files}: {os.path.basename(file_path)}")
-            
-            # Define a callback for progress updates
-            def update_callback(current=0, total=0, message=""):
-                if isinstance(current, str):  # For string messages
-                    self.status_update.emit(current)
-                else:  # For progress updates
-                    progress_percent = int((idx * self.passes + current) / (total_files * self.passes) * 100)
-                    self.progress_update.emit(progress_percent, idx+1, message)
-            
-            # Process the file
-            success = secure_delete(file_path, self.passes, self.deletion_mode, update_callback)
-            if not success:
-                self.status_update.emit(f"Failed to destroy: {file_path}")
+        while pending_dirs and not self.cancelled:
+            current_dir = pending_dirs.pop()
+            try:
+                with os.scandir(current_dir) as it:
+                    for entry in it:
+                        # Checked per entry so huge flat directories stop promptly
+                        if self.cancelled:
+                            break
+                        try:
+                            # Never follow symlinks: list the link itself, don't descend into it
+                            if entry.is_dir(follow_symlinks=False):
+                                pending_dirs.append(entry.path)
+                                continue
+                            st = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            errors += 1
+                            continue
+                        # [path, size, owner, mtime, hash]; hash is filled in on demand
+                        batch.append([entry.path, st.st_size, get_owner(st.st_uid, st.st_gid), st.st_mtime, ""])
+                        if len(batch) >= self.batch_size:
+                            scanned += len(batch)
+                            self.batch_ready.emit(batch)
+                            batch = []
+            except OSError:
+                errors += 1
         
-        self.progress_update.emit(100, total_files, "All files processed")
-        self.operation_complete.emit(True)
+        if batch:
+            scanned += len(batch)
+            self.batch_ready.emit(batch)
+        self.scan_complete.emit(scanned, errors)
+
+class HashWorker(QThread):
+    """Calculate hashes for inventory entries requested by the user"""
+    hash_ready = pyqtSignal(str, str)
+    
+    def __init__(self, file_paths):
+        super().__init__()
+        self.file_paths = file_paths
+    
+    def run(self):
+        for file_path in self.file_paths:
+            try:
+                self.hash_ready.emit(file_path, calculate_file_hash(file_path))
+            except Exception as e:
+                self.hash_ready.emit(file_path, f"Error: {e}")
+
+class FolderInventoryModel(QAbstractTableModel):
+    """Table model that keeps every scanned entry but only exposes rows as the view needs them"""
+    COLUMNS = ["Path", "Size", "Owner", "Modified", "MD5 Hash"]
+    FETCH_SIZE = 1000
+    
+    def __init__(self, root_path="", parent=None):
+        super().__init__(parent)
+        self.root_path = root_path
+        self.entries = []
+        self.loaded = 0
+        self.total_size = 0
+        self.sort_column = None
+        self.sort_order = Qt.AscendingOrder
+        self.pending_hashes = {}
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.loaded
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self.loaded:
+            return None
+        entry = self.entries[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return os.path.relpath(entry[0], self.root_path) if self.root_path else entry[0]
+            if column == 1:
+                return format_size(entry[1])
+            if column == 3:
+                return datetime.datetime.fromtimestamp(entry[3]).strftime('%Y-%m-%d %H:%M:%S')
+            return entry[column]
+        if role == Qt.ToolTipRole and column == 0:
+            return entry[0]
+        if role == Qt.TextAlignmentRole and column == 1:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+    
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.loaded < len(self.entries)
+    
+    def fetchMore(self, parent=QModelIndex()):
+        count = min(self.FETCH_SIZE, len(self.entries) - self.loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self.loaded, self.loaded + count - 1)
+        self.loaded += count
+        self.endInsertRows()
+    
+    def add_entries(self, batch):
+        self.entries.extend(batch)
+        self.total_size += sum(entry[1] for entry in batch)
+        # Show the first page right away; the view pulls the rest while scrolling
+        if self.loaded < self.FETCH_SIZE:
+            self.fetchMore()
+    
+    def sort(self, column, order=Qt.AscendingOrder):
+        # Qt passes -1 to mean "unsorted": keep the scan order
+        if column < 0:
+            self.sort_column = None
+            return
+        self.sort_column = column
+        self.sort_order = order
+        self.beginResetModel()
+        self.entries.sort(key=lambda entry: entry[column], reverse=(order == Qt.DescendingOrder))
+        self.endResetModel()
+    
+    def resort(self):
+        if self.sort_column is not None:
+            self.sort(self.sort_column, self.sort_order)
+    
+    def request_hashes(self, rows):
+        """Return the paths of the given rows that still need a hash"""
+        file_paths = []
+        for row in rows:
+            entry = self.entries[row]
+            if not entry[4] and entry[0] not in self.pending_hashes:
+                entry[4] = "Calculating..."
+                self.pending_hashes[entry[0]] = entry
+                file_paths.append(entry[0])
+        self.refresh_column(4)
+        return file_paths
+    
+    def set_hash(self, file_path, file_hash):
+        entry = self.pending_hashes.pop(file_path, None)
+        if entry is not None:
+            entry[4] = file_hash
+            self.refresh_column(4)
+    
+    def refresh_column(self, column):
+        if self.loaded:
+            self.dataChanged.emit(self.index(0, column), self.index(self.loaded - 1, column))
+
+# Destruction daemon
+def default_daemon_path(name, root_dir, user_dir):
+    """Pick a system location when running as root, a per-user one otherwise"""
+    if os.geteuid() == 0:
+        return os.path.join(root_dir, name)
+    return os.path.join(os.environ.get(user_dir[0]) or os.path.expanduser(user_dir[1]), name)
+
+DAEMON_SOCKET = os.environ.get("DATADESTROYER_SOCKET") or default_daemon_path(
+    "datadestroyer.sock", "/run", ("XDG_RUNTIME_DIR", "~"))
+# Seconds the GUI waits for the daemon before giving up
+DAEMON_GUI_TIMEOUT = 10
+
+DAEMON_STATE = os.environ.get("DATADESTROYER_STATE") or default_daemon_path(
+    "queue.json", "/var/lib/datadestroyer", ("XDG_STATE_HOME", "~/.local/state/datadestroyer"))
+
+class DestructionDaemon:
+    """Long-running job queue that wipes files for clients on a Unix socket
+
+    Jobs are plain dicts so they can be persisted as JSON and sent to
+    clients unchanged. Workers share one pool, but at most per_device
+    jobs run on the same block device at a time, since parallel
+    overwrites on one disk only make every job slower.
+    """
+    FINISHED_STATES = ("done", "failed", "cancelled")
+    HISTORY_LIMIT = 1000
+    
+    def __init__(self, socket_path=DAEMON_SOCKET, state_path=DAEMON_STATE, workers=4, per_device=1,
+                 metrics_textfile=METRICS_TEXTFILE):
+        self.socket_path = socket_path
+        self.state_path = state_path
+        self.metrics_textfile = metrics_textfile
+        self.workers = workers
+        self.per_device = per_device
+        self.lock = threading.Condition()
+        self.jobs = {}
+        # Heap of (-priority, job_id), so higher priority and then older jobs run first
+        self.queue = []
+        self.device_load = {}
+        self.subscribers = []
+        self.next_id = 1
+        self.running = False
+        self.server = None
+        self.load_state()
+    
+    def load_state(self):
+        try:
+            with open(self.state_path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return
+        self.next_id = state.get("next_id", 1)
+        for job in state.get("jobs", []):
+            # Jobs interrupted by a shutdown or crash are run again from the start
+            if job["state"] == "running":
+                job["state"] = "queued"
+                job["message"] = "Resumed after daemon restart"
+            self.jobs[job["job_id"]] = job
+            if job["state"] == "queued":
+                heapq.heappush(self.queue, (-job["priority"], job["job_id"]))
+    
+    def save_state(self):
+        # Called with self.lock held; write-then-rename keeps the file valid after a crash
+        finished = [job for job in self.jobs.values() if job["state"] in self.FINISHED_STATES]
+        for job in finished[:-self.HISTORY_LIMIT]:
+            del self.jobs[job["job_id"]]
+        tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"next_id": self.next_id, "jobs": list(self.jobs.values())}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.state_path)
+    
+    def publish(self, event):
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                # A client that stopped reading must not stall the workers
+                pass
+    
+    def subscribe(self):
+        subscriber = queue.Queue(maxsize=10000)
+        with self.lock:
+            self.subscribers.append(subscriber)
+        return subscriber
+    
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            if subscriber in self.subscribers:
+                self.subscribers.remove(subscriber)
+    
+    def set_state(self, job, state, message=""):
+        # Called with self.lock held
+        job["state"] = state
+        job["message"] = message
+        if state == "running":
+            job["started"] = time.time()
+        elif state in self.FINISHED_STATES:
+            job["finished"] = time.time()
+        # Publish first: the in-memory state is authoritative even if it cannot be persisted
+        self.publish({"event": "state", "job": dict(job)})
+        self.save_state()
+    
+    def report_error(self, message):
+        print(message, file=sys.stderr)
+        self.publish({"event": "error", "message": message})
+    
+    @staticmethod
+    def validate_filters(filters):
+        """Check the value types of ScanFilter options sent by a client"""
+        for key, value in filters.items():
+            if value is None:
+                continue
+            if key in ("include", "exclude"):
+                # A bare string would be compiled one character per glob, e.g. "*"
+                if not isinstance(value, list) or not all(isinstance(p, str) for p in value):
+                    raise ValueError(f"{key} must be a list of strings")
+            elif key in ("min_size", "max_size", "older_than_days", "newer_than_days"):
+                if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                    raise ValueError(f"{key} must be a non-negative integer")
+            elif key in ("user", "group"):
+                if not isinstance(value, str):
+                    raise ValueError(f"{key} must be a string")
+            elif key == "same_filesystem":
+                if not isinstance(value, bool):
+                    raise ValueError(f"{key} must be a boolean")
+    
+    def submit(self, request):
+        paths = request.get("paths")
+        if not paths or not isinstance(paths, list):
+            raise ValueError("paths must be a non-empty list")
+        scheme = request.get("scheme", "standard")
+        if scheme not in ("standard", "nsa"):
+            raise ValueError(f"Unknown scheme: {scheme}")
+        passes = 4 if scheme == "nsa" else int(request.get("passes", 3))
+        if not 1 <= passes <= 10:
+            raise ValueError("passes must be between 1 and 10")
+        filters = request.get("filters") or {}
+        if not isinstance(filters, dict):
+            raise ValueError("filters must be an object")
+        
+        paths = [os.path.abspath(path) for path in paths]
+        try:
+            device = os.stat(paths[0]).st_dev
+        except OSError as e:
+            raise ValueError(f"Cannot access {paths[0]}: {e}")
+        # Check and compile the filters once now so bad options are rejected instead of failing the job later
+        if filters:
+            self.validate_filters(filters)
+            try:
+                ScanFilter(paths[0], **filters)
+            except TypeError as e:
+                raise ValueError(f"Invalid filters: {e}")
+        
+        with self.lock:
+            job = {
+                "job_id": self.next_id,
+                "paths": paths,
+                "scheme": scheme,
+                "passes": passes,
+                "priority": int(request.get("priority", 0)),
+                "filters": filters,
+                "scrub_metadata": bool(request.get("scrub_metadata", False)),
+                "device": device,
+                "state": "queued",
+                "message": "",
+                "submitted": time.time(),
+                "started": None,
+                "finished": None,
+                "failed_files": [],
+            }
+            self.next_id += 1
+            self.jobs[job["job_id"]] = job
+            try:
+                self.save_state()
+            except OSError:
+                # Never accept a job that would be lost on restart
+                del self.jobs[job["job_id"]]
+                self.next_id -= 1
+                raise
+            heapq.heappush(self.queue, (-job["priority"], job["job_id"]))
+            self.publish({"event": "state", "job": dict(job)})
+            self.lock.notify_all()
+        return job
+    
+    def cancel(self, job_id):
+        with self.lock:
+            job = self.jobs.get(job_id)
+            if job is None:
+                raise ValueError(f"Unknown job: {job_id}")
+            if job["state"] == "queued":
+                self.set_state(job, "cancelled", "Cancelled before start")
+            elif job["state"] == "running":
+                # Picked up by destroy_files between two files
+                job["cancel_requested"] = True
+            return job
+    
+    def next_job(self):
+        """Block until a queued job can run on a device with a free slot"""
+        with self.lock:
+            while self.running:
+                deferred = []
+                job = None
+                while self.queue:
+                    entry = heapq.heappop(self.queue)
+                    candidate = self.jobs.get(entry[1])
+                    if candidate is None or candidate["state"] != "queued":
+                        continue
+                    if self.device_load.get(candidate["device"], 0) >= self.per_device:
+                        deferred.append(entry)
+                        continue
+                    job = candidate
+                    break
+                for entry in deferred:
+                    heapq.heappush(self.queue, entry)
+                if job is not None:
+                    try:
+                        self.set_state(job, "running")
+                    except OSError:
+                        # Put the job back so it is retried once the state can be saved
+                        job["state"] = "queued"
+                        heapq.heappush(self.queue, (-job["priority"], job["job_id"]))
+                        raise
+                    self.device_load[job["device"]] = self.device_load.get(job["device"], 0) + 1
+                    return job
+                self.lock.wait()
+            return None
+    
+    def expand_paths(self, job, status_callback):
+        """Turn a job's paths into files to wipe, using the same scan as folder mode"""
+        files_to_process = []
+        extra_links = {}
+        directories = []
+        for path in job["paths"]:
+            if os.path.isdir(path) and not os.path.islink(path):
+                scan_filter = ScanFilter(path, **job["filters"]) if job["filters"] else None
+                index = scan_folder(path, scan_filter)
+                files_to_process.extend(index.primary_paths())
+                extra_links.update(index.extra_links())
+                directories.extend(index.directories)
+                if index.symlinks:
+                    status_callback(f"Skipping {len(index.symlinks)} symbolic links in {path}")
+                if index.shared_inodes():
+                    status_callback(f"{index.shared_inodes()} files in {path} share data with unselected "
+                                    f"hard links and will only be unlinked")
+            else:
+                files_to_process.append(path)
+        return files_to_process, extra_links, directories
+    
+    def run_job(self, job):
+        job_id = job["job_id"]
+        status_callback = lambda message: self.publish(
+            {"event": "status", "job_id": job_id, "message": message})
+        progress_callback = lambda percent, file_num, message: self.publish(
+            {"event": "progress", "job_id": job_id, "percent": percent, "file": file_num, "message": message})
+        try:
+            files_to_process, extra_links, directories = self.expand_paths(job, status_callback)
+            failed = destroy_files(files_to_process, job["passes"], job["scheme"], extra_links,
+                                   None, status_callback, progress_callback,
+                                   should_stop=lambda: job.get("cancel_requested", False),
+                                   scrub_metadata=job.get("scrub_metadata", False),
+                                   directories=directories)
+        except Exception as e:
+            with self.lock:
+                self.set_state(job, "failed", f"Error: {e}")
+            return
+        
+        with self.lock:
+            job["failed_files"] = failed
+            if job.pop("cancel_requested", False):
+                self.set_state(job, "cancelled", f"Cancelled, {len(failed)} files left")
+            elif failed:
+                self.set_state(job, "failed", f"{len(failed)} of {len(files_to_process)} files failed")
+            else:
+                file_count = len(files_to_process)
+                self.set_state(job, "done", f"{file_count} file{'s' if file_count != 1 else ''} destroyed")
+    
+    def worker_loop(self):
+        while True:
+            try:
+                job = self.next_job()
+            except Exception as e:
+                self.report_error(f"Error starting job: {e}")
+                # Back off instead of spinning while e.g. the state file stays unwritable
+                time.sleep(5)
+                continue
+            if job is None:
+                return
+            try:
+                self.run_job(job)
+            except Exception as e:
+                self.report_error(f"Error finishing job {job['job_id']}: {e}")
+            finally:
+                with self.lock:
+                    self.device_load[job["device"]] -= 1
+                    self.lock.notify_all()
+            self.export_metrics()
+    
+    def export_metrics(self):
+        if not self.metrics_textfile:
+            return
+        try:
+            write_prometheus_textfile(self.metrics_textfile)
+        except OSError as e:
+            self.report_error(f"Error exporting metrics: {e}")
+    
+    def handle_request(self, request):
+        """Handle a single non-streaming client request"""
+        cmd = request.get("cmd")
+        try:
+            if cmd == "submit":
+                return {"ok": True, "job": self.submit(request)}
+            if cmd == "cancel":
+                return {"ok": True, "job": self.cancel(int(request.get("job_id", 0)))}
+            if cmd == "status":
+                with self.lock:
+                    return {"ok": True, "jobs": [dict(job) for job in self.jobs.values()]}
+            if cmd == "metrics":
+                return {"ok": True, "metrics": metrics.to_prometheus()}
+            return {"ok": False, "error": f"Unknown command: {cmd}"}
+        except (ValueError, TypeError) as e:
+            return {"ok": False, "error": str(e)}
+        except OSError as e:
+            return {"ok": False, "error": f"Cannot save queue state to {self.state_path}: {e}"}
+    
+    def start(self):
+        """Bind the socket and start the worker pool without blocking"""
+        if os.path.exists(self.socket_path):
+            try:
+                DaemonClient(self.socket_path, timeout=1).request("status")
+                raise RuntimeError(f"Daemon already running on {self.socket_path}")
+            except OSError:
+                # Stale socket left behind by a daemon that did not shut down cleanly
+                os.unlink(self.socket_path)
+        
+        # Fail at startup rather than on the first submitted job if the queue cannot be persisted
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        with self.lock:
+            self.save_state()
+        
+        # Jobs can wipe anything the daemon's user can write, so only that user may connect.
+        # The umask makes bind() create the socket as 0600, leaving no window before chmod.
+        old_umask = os.umask(0o177)
+        try:
+            self.server = DaemonServer(self.socket_path, self)
+        finally:
+            os.umask(old_umask)
+        os.chmod(self.socket_path, 0o600)
+        self.running = True
+        for _ in range(self.workers):
+            threading.Thread(target=self.worker_loop, daemon=True).start()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def stop(self):
+        with self.lock:
+            self.running = False
+            self.lock.notify_all()
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+    
+    def serve_forever(self):
+        if not self.running:
+            self.start()
+        stop_event = threading.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *args: stop_event.set())
+        while not stop_event.wait(1):
+            pass
+        self.stop()
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Newline-delimited JSON protocol: one request per line, one reply per line"""
+    def send(self, message):
+        self.wfile.write(json.dumps(message).encode() + b"\n")
+        self.wfile.flush()
+    
+    def handle(self):
+        destroyer = self.server.destroyer
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+            except ValueError:
+                self.send({"ok": False, "error": "Invalid JSON"})
+                continue
+            if not isinstance(request, dict):
+                self.send({"ok": False, "error": "Request must be a JSON object"})
+                continue
+            if request.get("cmd") == "subscribe":
+                self.stream_events(destroyer)
+                return
+            self.send(destroyer.handle_request(request))
+    
+    def stream_events(self, destroyer):
+        subscriber = destroyer.subscribe()
+        try:
+            self.send({"ok": True})
+            while destroyer.running:
+                try:
+                    event = subscriber.get(timeout=1)
+                except queue.Empty:
+                    continue
+                self.send(event)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            destroyer.unsubscribe(subscriber)
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+    
+    def __init__(self, socket_path, destroyer):
+        self.destroyer = destroyer
+        super().__init__(socket_path, DaemonRequestHandler)
+
+class DaemonClient:
+    """Talk to a running DestructionDaemon over its Unix socket"""
+    def __init__(self, socket_path=DAEMON_SOCKET, timeout=None):
+        self.socket_path = socket_path
+        self.timeout = timeout
+    
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        return sock
+    
+    def request(self, cmd, **fields):
+        with self.connect() as sock, sock.makefile("rwb") as stream:
+            stream.write(json.dumps(dict(fields, cmd=cmd)).encode() + b"\n")
+            stream.flush()
+            reply = stream.readline()
+        if not reply:
+            raise ConnectionError("Daemon closed the connection")
+        return json.loads(reply)
+    
+    def submit(self, paths, scheme="standard", passes=3, priority=0, filters=None, scrub_metadata=False):
+        # The daemon has its own working directory
+        paths = [os.path.abspath(path) for path in paths]
+        return self.request("submit", paths=paths, scheme=scheme, passes=passes,
+                            priority=priority, filters=filters or {}, scrub_metadata=scrub_metadata)
+    
+    def subscribe(self):
+        """Open an event stream; no event published after this returns is missed"""
+        sock = self.connect()
+        stream = sock.makefile("rwb")
+        try:
+            stream.write(b'{"cmd": "subscribe"}\n')
+            stream.flush()
+            reply = stream.readline()
+        except OSError:
+            stream.close()
+            sock.close()
+            raise
+        if not reply or not json.loads(reply).get("ok"):
+            stream.close()
+            sock.close()
+            raise ConnectionError("Daemon refused the subscription")
+        # The handshake honours the client timeout; the event stream waits indefinitely
+        sock.settimeout(None)
+        # The stream keeps the connection open after the socket object is closed
+        sock.close()
+        return stream
+    
+    def events(self, stream=None):
+        """Yield progress and state events until the connection is closed"""
+        with stream or self.subscribe() as stream:
+            for line in stream:
+                yield json.loads(line)
+
+class DaemonEventListener(QThread):
+    """Forward daemon events to the GUI thread"""
+    event_received = pyqtSignal(dict)
+    connection_lost = pyqtSignal(str)
+    
+    def __init__(self, stream):
+        super().__init__()
+        self.stream = stream
+    
+    def run(self):
+        try:
+            for event in DaemonClient().events(self.stream):
+                self.event_received.emit(event)
+            self.connection_lost.emit("Daemon closed the connection")
+        except OSError as e:
+            self.connection_lost.emit(str(e))
 
 # Modern UI
 class SecuronisDataDestroyer(QMainWindow):
@@ -431,6 +1688,44 @@ class SecuronisDataDestroyer(QMainWindow):
         file_layout.addWidget(self.browse_button)
         main_tab_layout.addLayout(file_layout)
         
+        # Folder filters (only shown in folder mode)
+        self.filter_widget = QWidget()
+        filter_layout = QVBoxLayout(self.filter_widget)
+        filter_layout.setContentsMargins(0, 0, 0, 0)
+        
+        glob_layout = QHBoxLayout()
+        self.include_input = QLineEdit()
+        self.include_input.setPlaceholderText("e.g. *.log, data/*.db")
+        self.exclude_input = QLineEdit()
+        self.exclude_input.setPlaceholderText("e.g. .git, *.keep")
+        glob_layout.addWidget(QLabel("Include:"))
+        glob_layout.addWidget(self.include_input)
+        glob_layout.addWidget(QLabel("Exclude:"))
+        glob_layout.addWidget(self.exclude_input)
+        filter_layout.addLayout(glob_layout)
+        
+        predicate_layout = QHBoxLayout()
+        self.min_size_input = QLineEdit()
+        self.min_size_input.setPlaceholderText("Min size")
+        self.max_size_input = QLineEdit()
+        self.max_size_input.setPlaceholderText("Max size")
+        self.older_than_spinbox = QSpinBox()
+        self.older_than_spinbox.setRange(0, 36500)
+        self.older_than_spinbox.setSpecialValueText("Any age")
+        self.older_than_spinbox.setSuffix(" days old")
+        self.owner_input = QLineEdit()
+        self.owner_input.setPlaceholderText("Owner")
+        self.group_input = QLineEdit()
+        self.group_input.setPlaceholderText("Group")
+        self.same_fs_checkbox = QCheckBox("Same filesystem only")
+        for widget in (self.min_size_input, self.max_size_input, self.older_than_spinbox,
+                       self.owner_input, self.group_input, self.same_fs_checkbox):
+            predicate_layout.addWidget(widget)
+        filter_layout.addLayout(predicate_layout)
+        
+        self.filter_widget.setVisible(False)
+        main_tab_layout.addWidget(self.filter_widget)
+        
         # Add file info display
         self.file_info_tree = QTreeWidget()
         self.file_info_tree.setHeaderLabel("File Information")
@@ -469,6 +1764,48 @@ class SecuronisDataDestroyer(QMainWindow):
         # Add the main tab to tab widget
         self.tab_widget.addTab(main_tab, "File Selection")
         
+        # Folder inventory tab
+        inventory_tab = QWidget()
+        inventory_tab_layout = QVBoxLayout(inventory_tab)
+        
+        self.inventory_view = QTableView()
+        self.inventory_view.setSortingEnabled(True)
+        self.inventory_view.setAlternatingRowColors(True)
+        self.inventory_view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.inventory_view.verticalHeader().setVisible(False)
+        # Fixed row heights let the view skip measuring millions of rows
+        self.inventory_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.inventory_view.horizontalHeader().setStretchLastSection(True)
+        self.inventory_view.setStyleSheet("""
+            QTableView {
+                background-color: #2d2d2d;
+                alternate-background-color: #333333;
+                color: #e0e0e0;
+                border: 1px solid #3d3d3d;
+            }
+            QHeaderView::section {
+                background-color: #424242;
+                color: white;
+                padding: 4px;
+                border: 1px solid #3d3d3d;
+            }
+        """)
+        self.inventory_model = FolderInventoryModel()
+        self.inventory_view.setModel(self.inventory_model)
+        inventory_tab_layout.addWidget(self.inventory_view)
+        
+        inventory_button_layout = QHBoxLayout()
+        self.hash_button = QPushButton("Compute Hash")
+        self.hash_button.clicked.connect(self.compute_selected_hashes)
+        self.inventory_label = QLabel("No folder scanned")
+        
+        inventory_button_layout.addWidget(self.hash_button)
+        inventory_button_layout.addWidget(self.inventory_label)
+        inventory_button_layout.addStretch(1)
+        inventory_tab_layout.addLayout(inventory_button_layout)
+        
+        self.tab_widget.addTab(inventory_tab, "Folder Inventory")
+        
         # Log tab
         log_tab = QWidget()
         log_tab_layout = QVBoxLayout(log_tab)
@@ -517,9 +1854,25 @@ class SecuronisDataDestroyer(QMainWindow):
         passes_layout.addWidget(passes_label)
         passes_layout.addWidget(self.passes_spinbox)
         
+        # Profiling option
+        self.profile_checkbox = QCheckBox("Profile Job")
+        self.profile_checkbox.setToolTip("Run the job under cProfile and tracemalloc and log the results")
+        
         # Add all to main options layout
         options_layout.addLayout(mode_group_layout)
         options_layout.addLayout(passes_layout)
+        options_layout.addWidget(self.profile_checkbox)
+        
+        # Batched truncate/rename/unlink after the wipes, plus folder removal
+        self.scrub_checkbox = QCheckBox("Scrub Metadata")
+        self.scrub_checkbox.setToolTip("Truncate, rename and unlink files in per-directory batches after "
+                                       "overwriting, then rename and remove the emptied folders")
+        options_layout.addWidget(self.scrub_checkbox)
+        
+        # Queue jobs on a running destruction daemon instead of wiping in this process
+        self.daemon_checkbox = QCheckBox("Queue on Daemon")
+        self.daemon_checkbox.setToolTip(f"Submit jobs to the daemon listening on {DAEMON_SOCKET}")
+        options_layout.addWidget(self.daemon_checkbox)
         options_layout.addStretch(1)
         main_layout.addLayout(options_layout)
         
@@ -552,6 +1905,11 @@ class SecuronisDataDestroyer(QMainWindow):
         self.files_to_process = []
         self.process_mode = "single"
         self.deletion_mode = "standard"
+        self.inventory_scanner = None
+        self.stopped_scanners = []
+        self.hash_workers = []
+        self.daemon_listener = None
+        self.daemon_job_id = None
         
         # Log initial message
         self.log_message("Application started. Ready for operation.")
@@ -567,6 +1925,7 @@ class SecuronisDataDestroyer(QMainWindow):
             self.file_label.setText("Selected Folder:")
             self.browse_button.clicked.disconnect()
             self.browse_button.clicked.connect(self.browse_folder)
+        self.filter_widget.setVisible(self.process_mode == "folder")
         
         self.file_path_input.clear()
     
@@ -609,7 +1968,7 @@ class SecuronisDataDestroyer(QMainWindow):
             self.display_file_info(info)
             self.log_message(f"Displayed information for file: {file_path}")
         elif os.path.isdir(file_path):
-            QMessageBox.information(self, "Information", "Selected path is a directory. File information is only available for individual files.")
+            self.show_folder_inventory(file_path)
         else:
             QMessageBox.critical(self, "Error", "The selected file does not exist.")
     
@@ -632,6 +1991,59 @@ class SecuronisDataDestroyer(QMainWindow):
         for i in range(self.file_info_tree.columnCount()):
             self.file_info_tree.resizeColumnToContents(i)
     
+    def show_folder_inventory(self, folder_path):
+        # Stop a scan that is still running for a previous folder
+        if self.inventory_scanner and self.inventory_scanner.isRunning():
+            old_scanner = self.inventory_scanner
+            old_scanner.stop()
+            old_scanner.batch_ready.disconnect()
+            old_scanner.scan_complete.disconnect()
+            # Keep a reference until the thread exits so Qt does not destroy it while running
+            self.stopped_scanners.append(old_scanner)
+            old_scanner.finished.connect(lambda: self.stopped_scanners.remove(old_scanner))
+        
+        self.inventory_model = FolderInventoryModel(folder_path)
+        self.inventory_view.setModel(self.inventory_model)
+        self.inventory_view.horizontalHeader().setSortIndicator(-1, Qt.AscendingOrder)
+        self.inventory_label.setText("Scanning...")
+        self.tab_widget.setCurrentIndex(1)
+        self.log_message(f"Scanning folder inventory: {folder_path}")
+        
+        self.inventory_scanner = InventoryScanner(folder_path)
+        self.inventory_scanner.batch_ready.connect(self.add_inventory_batch)
+        self.inventory_scanner.scan_complete.connect(self.inventory_scan_complete)
+        self.inventory_scanner.start()
+    
+    def add_inventory_batch(self, batch):
+        self.inventory_model.add_entries(batch)
+        self.inventory_label.setText(f"Scanning... {len(self.inventory_model.entries)} files, "
+                                     f"{format_size(self.inventory_model.total_size)}")
+    
+    def inventory_scan_complete(self, scanned, errors):
+        # Entries that arrived after the user picked a sort column are appended unsorted
+        self.inventory_model.resort()
+        summary = f"{scanned} files, {format_size(self.inventory_model.total_size)}"
+        if errors:
+            summary += f", {errors} unreadable"
+        self.inventory_label.setText(summary)
+        self.log_message(f"Folder inventory complete: {summary}")
+    
+    def compute_selected_hashes(self):
+        rows = sorted(index.row() for index in self.inventory_view.selectionModel().selectedRows())
+        if not rows:
+            QMessageBox.warning(self, "Warning", "Please select files in the inventory first.")
+            return
+        
+        file_paths = self.inventory_model.request_hashes(rows)
+        if not file_paths:
+            return
+        # Keep references to running workers so they are not garbage collected
+        hash_worker = HashWorker(file_paths)
+        hash_worker.hash_ready.connect(self.inventory_model.set_hash)
+        hash_worker.finished.connect(lambda: self.hash_workers.remove(hash_worker))
+        self.hash_workers.append(hash_worker)
+        hash_worker.start()
+    
     def verify_file(self):
         file_path = self.file_path_input.text().strip()
         if not file_path:
@@ -650,12 +2062,34 @@ class SecuronisDataDestroyer(QMainWindow):
             QMessageBox.warning(self, "File Verification", f"The file {file_path} does not exist.")
 
     
-    def find_files_in_folder(self, folder_path):
-        files = []
-        for root, _, filenames in os.walk(folder_path):
-            for filename in filenames:
-                files.append(os.path.join(root, filename))
-        return files
+    def build_filter_options(self):
+        """Collect the folder filter inputs as ScanFilter keyword arguments, or None if none are set"""
+        split_globs = lambda text: [p.strip() for p in text.split(",") if p.strip()]
+        include = split_globs(self.include_input.text())
+        exclude = split_globs(self.exclude_input.text())
+        min_size = self.min_size_input.text().strip()
+        max_size = self.max_size_input.text().strip()
+        older_than_days = self.older_than_spinbox.value()
+        user = self.owner_input.text().strip()
+        group = self.group_input.text().strip()
+        same_filesystem = self.same_fs_checkbox.isChecked()
+        
+        if not (include or exclude or min_size or max_size or older_than_days
+                or user or group or same_filesystem):
+            return None
+        return {
+            "include": include,
+            "exclude": exclude,
+            "min_size": parse_size(min_size) if min_size else None,
+            "max_size": parse_size(max_size) if max_size else None,
+            "older_than_days": older_than_days or None,
+            "user": user or None,
+            "group": group or None,
+            "same_filesystem": same_filesystem,
+        }
+    
+    def find_files_in_folder(self, folder_path, scan_filter=None):
+        return scan_folder(folder_path, scan_filter)
     
     def start_destruction(self):
         path = self.file_path_input.text().strip()
@@ -665,6 +2099,11 @@ class SecuronisDataDestroyer(QMainWindow):
         
         # Prepare files list based on mode
         self.files_to_process = []
+        extra_links = {}
+        shared_count = 0
+        directories = []
+        filter_options = None
+        scan_filter = None
         if self.process_mode == "single":
             if os.path.isfile(path):
                 self.files_to_process = [path]
@@ -673,7 +2112,24 @@ class SecuronisDataDestroyer(QMainWindow):
                 return
         else:  # folder mode
             if os.path.isdir(path):
-                self.files_to_process = self.find_files_in_folder(path)
+                try:
+                    filter_options = self.build_filter_options()
+                    scan_filter = ScanFilter(path, **filter_options) if filter_options else None
+                except ValueError as e:
+                    QMessageBox.critical(self, "Error", f"Invalid filter: {e}")
+                    return
+                index = self.find_files_in_folder(path, scan_filter)
+                if index.filtered_files or index.pruned_dirs:
+                    self.log_message(f"Filters excluded {index.filtered_files} files and "
+                                     f"{index.pruned_dirs} directories")
+                self.files_to_process = index.primary_paths()
+                extra_links = index.extra_links()
+                shared_count = index.shared_inodes()
+                directories = index.directories
+                if index.symlinks:
+                    self.log_message(f"Skipping {len(index.symlinks)} symbolic link{'s' if len(index.symlinks) > 1 else ''} (not followed)")
+                if index.special_files:
+                    self.log_message(f"Skipping {len(index.special_files)} special file{'s' if len(index.special_files) > 1 else ''} (FIFOs, sockets, devices)")
                 if not self.files_to_process:
                     QMessageBox.information(self, "Information", "No files found in the selected folder.")
                     return
@@ -689,6 +2145,15 @@ class SecuronisDataDestroyer(QMainWindow):
             confirm_message += f"{self.files_to_process[0]}\n"
         else:
             confirm_message += f"{file_count} files in {path}\n"
+        
+        link_count = sum(len(links) for links in extra_links.values())
+        if link_count:
+            confirm_message += f"plus {link_count} additional hard link{'s' if link_count > 1 else ''} to these files\n"
+        if shared_count:
+            confirm_message += (f"{shared_count} file{'s' if shared_count > 1 else ''} share data with unselected "
+                                f"hard links and will only be unlinked, not overwritten\n")
+        if directories and self.scrub_checkbox.isChecked():
+            confirm_message += "The emptied folders, including the selected one, will be removed as well.\n"
             
         confirm_message += "\nThis action CANNOT be undone!"
         
@@ -703,8 +2168,12 @@ class SecuronisDataDestroyer(QMainWindow):
             self.status_label.setText("Starting destruction process...")
             self.log_message("---- Starting new destruction process ----")
             
-            # Setup and start worker thread
             passes = self.passes_spinbox.value() if self.deletion_mode == "standard" else 4  # NSA mode has fixed 4 passes
+            if self.daemon_checkbox.isChecked():
+                self.submit_to_daemon(path, passes, filter_options)
+                return
+            
+            # Setup and start worker thread
             self.worker = DestructionWorker(self.files_to_process, passes)
             self.worker.progress_update.connect(self.update_progress)
             self.worker.status_update.connect(self.log_message)
@@ -712,8 +2181,62 @@ class SecuronisDataDestroyer(QMainWindow):
             
             # Set deletion mode property on worker
             self.worker.deletion_mode = self.deletion_mode
+            self.worker.extra_links = extra_links
+            self.worker.scan_filter = scan_filter
+            self.worker.scrub_metadata = self.scrub_checkbox.isChecked()
+            self.worker.directories = directories
+            if self.profile_checkbox.isChecked():
+                self.worker.profiling = True
+                self.worker.profile_path = os.path.join(
+                    tempfile.gettempdir(), datetime.datetime.now().strftime("datadestroyer-%Y%m%d-%H%M%S.prof"))
             self.worker.start()
     
+    def submit_to_daemon(self, path, passes, filter_options):
+        # This runs on the GUI thread: a daemon that stops answering must not freeze the window
+        client = DaemonClient(timeout=DAEMON_GUI_TIMEOUT)
+        try:
+            # Attach to the daemon's event stream before submitting so no event is missed
+            if not (self.daemon_listener and self.daemon_listener.isRunning()):
+                self.daemon_listener = DaemonEventListener(client.subscribe())
+                self.daemon_listener.event_received.connect(self.handle_daemon_event)
+                self.daemon_listener.connection_lost.connect(self.daemon_connection_lost)
+                self.daemon_listener.start()
+            reply = client.submit([path], self.deletion_mode, passes, filters=filter_options,
+                                  scrub_metadata=self.scrub_checkbox.isChecked())
+        except OSError as e:
+            reply = {"ok": False, "error": f"Cannot reach daemon at {DAEMON_SOCKET}: {e}"}
+        if not reply.get("ok"):
+            self.log_message(f"Daemon rejected job: {reply.get('error')}")
+            QMessageBox.critical(self, "Error", f"Daemon rejected job: {reply.get('error')}")
+            self.destroy_button.setEnabled(True)
+            self.browse_button.setEnabled(True)
+            return
+        
+        self.daemon_job_id = reply["job"]["job_id"]
+        self.log_message(f"Queued as daemon job {self.daemon_job_id}")
+    
+    def handle_daemon_event(self, event):
+        job = event.get("job", {})
+        if self.daemon_job_id is None or self.daemon_job_id not in (event.get("job_id"), job.get("job_id")):
+            return
+        
+        if event.get("event") == "progress":
+            self.update_progress(event["percent"], event["file"], event["message"])
+        elif event.get("event") == "status":
+            self.log_message(event["message"])
+        elif event.get("event") == "state":
+            self.log_message(f"Daemon job {self.daemon_job_id}: {job['state']} {job['message']}".rstrip())
+            if job["state"] in DestructionDaemon.FINISHED_STATES:
+                self.daemon_job_id = None
+                self.process_complete(job["state"] == "done")
+    
+    def daemon_connection_lost(self, reason):
+        if self.daemon_job_id is not None:
+            self.log_message(f"Lost connection to daemon: {reason}")
+            self.daemon_job_id = None
+            self.destroy_button.setEnabled(True)
+            self.browse_button.setEnabled(True)
+    
     def update_progress(self, percent, file_num, message):
         self.progress_bar.setValue(percent)
         self.status_label.setText(message)
@@ -729,8 +2252,84 @@ class SecuronisDataDestroyer(QMainWindow):
                               f"Completed processing {file_count} file{'s' if file_count > 1 else ''}.")
         self.log_message("---- Destruction process completed ----")
 
+def run_cli(args):
+    """Headless daemon and client commands; returns an exit code"""
+    if args.daemon:
+        destroyer = DestructionDaemon(args.socket, args.state, args.workers, args.per_device)
+        try:
+            destroyer.start()
+        except (OSError, RuntimeError) as e:
+            print(f"Error: {e}")
+            return 1
+        print(f"Daemon listening on {args.socket} ({args.workers} workers, "
+              f"{args.per_device} job{'s' if args.per_device > 1 else ''} per device)")
+        destroyer.serve_forever()
+        return 0
+    
+    client = DaemonClient(args.socket)
+    stream = None
+    try:
+        if args.submit:
+            # Subscribe before submitting so a job that finishes quickly is not missed
+            if args.watch:
+                stream = client.subscribe()
+            filters = {"include": args.include, "exclude": args.exclude} if args.include or args.exclude else None
+            reply = client.submit(args.submit, args.scheme, args.passes, args.priority, filters,
+                                  args.scrub_metadata)
+            if not reply["ok"]:
+                if stream:
+                    stream.close()
+                print(f"Error: {reply['error']}")
+                return 1
+            print(f"Queued job {reply['job']['job_id']}")
+            job_id = reply["job"]["job_id"]
+        elif args.cancel:
+            reply = client.request("cancel", job_id=args.cancel)
+            print(reply["job"]["state"] if reply["ok"] else f"Error: {reply['error']}")
+            return 0 if reply["ok"] else 1
+        elif args.status:
+            for job in client.request("status")["jobs"]:
+                print(f"{job['job_id']:>6}  {job['state']:<10} prio {job['priority']:<4} "
+                      f"{job['scheme']:<8} {', '.join(job['paths'])}  {job['message']}")
+            return 0
+        
+        if args.watch:
+            for event in client.events(stream):
+                if event.get("event") == "state":
+                    job = event["job"]
+                    print(f"[job {job['job_id']}] {job['state']} {job['message']}".rstrip())
+                    if args.submit and job["job_id"] == job_id and job["state"] in DestructionDaemon.FINISHED_STATES:
+                        return 0 if job["state"] == "done" else 1
+                elif event.get("event") == "status":
+                    print(f"[job {event['job_id']}] {event['message']}")
+        return 0
+    except OSError as e:
+        print(f"Error: cannot reach daemon at {args.socket}: {e}")
+        return 1
+
 # Main execution
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Securonis Data Destroyer")
+    parser.add_argument("--daemon", action="store_true", help="run the headless destruction daemon")
+    parser.add_argument("--socket", default=DAEMON_SOCKET, help="daemon Unix socket path")
+    parser.add_argument("--state", default=DAEMON_STATE, help="daemon persistent queue file")
+    parser.add_argument("--workers", type=int, default=4, help="daemon worker pool size")
+    parser.add_argument("--per-device", type=int, default=1, help="concurrent jobs per block device")
+    parser.add_argument("--submit", nargs="+", metavar="PATH", help="queue a job on the daemon")
+    parser.add_argument("--scheme", choices=("standard", "nsa"), default="standard")
+    parser.add_argument("--passes", type=int, default=3)
+    parser.add_argument("--priority", type=int, default=0, help="higher runs first")
+    parser.add_argument("--include", action="append", default=[], metavar="GLOB")
+    parser.add_argument("--exclude", action="append", default=[], metavar="GLOB")
+    parser.add_argument("--scrub-metadata", action="store_true",
+                        help="truncate and unlink in batches, then remove emptied directories")
+    parser.add_argument("--cancel", type=int, metavar="JOB_ID", help="cancel a daemon job")
+    parser.add_argument("--status", action="store_true", help="list daemon jobs")
+    parser.add_argument("--watch", action="store_true", help="stream daemon events")
+    # Unknown options are left for Qt (e.g. -style)
+    args, _ = parser.parse_known_args()
+    headless = args.daemon or args.submit or args.cancel or args.status or args.watch
+    
     # Linux dağıtım bilgilerini al
     try:
         with open('/etc/os-release', 'r') as f:
@@ -762,6 +2361,9 @@ if __name__ == "__main__":
     else:
         print("\nRunning with root privileges. Full system access enabled.\n")
     
+    if headless:
+        sys.exit(run_cli(args))
+    
     # Handle high DPI screens better
     if hasattr(Qt, 'AA_EnableHighDpiScaling'):
         QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)